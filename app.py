@@ -1,14 +1,19 @@
 #v2
 import io
 import csv
+import hashlib
+import json
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Tuple, TypeVar
 
 import pandas as pd
 import streamlit as st
+import streamlit.components.v1 as components
 
 from pdf_to_heats_xlsx import parse_pdf, build_workbook, Event, AlternateEntry
 
+T = TypeVar("T")
+
 
 HEATS_HEADERS = [
     "#",
@@ -33,27 +38,40 @@ ALT_HEADERS = [
 ]
 
 
-def events_to_rows(events: List[Event]) -> List[List[str]]:
-    rows: List[List[str]] = []
-    for ev in events:
-        for heat in ev.heats:
-            row: List[str] = [
-                str(ev.number),
-                ev.gender,
-                ev.event_code,
-                ev.age_group,
-                heat.label,
-                "",  # Cal
-            ]
+def pdf_digest(pdf_bytes: bytes) -> str:
+    """Short content hash used to key everything derived from an uploaded PDF."""
+    return hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
 
-            for lane in range(10):
-                row.append(heat.lanes.get(lane, ""))
 
-            # Analyst columns
-            row.extend([""] * 4)
-            rows.append(row)
+@st.cache_data(show_spinner="Parsing PDF…", max_entries=8)
+def _parse_pdf_cached(pdf_hash: str, _pdf_bytes: bytes) -> Tuple[str, List[Event], List[AlternateEntry]]:
+    # Re-parsing the same upload is the most expensive thing the app does, so
+    # results are cached on the PDF's digest. The leading underscore tells
+    # Streamlit not to hash `_pdf_bytes` itself on every call. The bytes are
+    # read from the upload exactly once by the caller; BytesIO shares that
+    # buffer rather than copying it, so the PDF is only held in memory once.
+    return parse_pdf(io.BytesIO(_pdf_bytes))
 
-    return rows
+
+# Blank Analyst columns, built once for events_to_rows().
+_BLANK_ANALYSTS = ["", "", "", ""]
+
+
+def events_to_rows(events: List[Event]) -> List[List[str]]:
+    return [
+        [
+            str(ev.number),
+            ev.gender,
+            ev.event_code,
+            ev.age_group,
+            heat.label,
+            "",  # Cal
+        ]
+        + heat.lanes  # lanes 0-9, already "" where empty
+        + _BLANK_ANALYSTS  # Analyst columns
+        for ev in events
+        for heat in ev.heats
+    ]
 
 
 def alternates_to_rows(alternates: List[AlternateEntry]) -> List[List[str]]:
@@ -84,50 +102,92 @@ def rows_to_delimited(headers: List[str], rows: List[List[str]], delimiter: str)
     return buf.getvalue()
 
 
-def dataframe_from_rows(headers: List[str], rows: List[List[str]]) -> pd.DataFrame:
-    # Ensure consistent row width
-    fixed_rows = [r + [""] * (len(headers) - len(r)) for r in rows]
-    return pd.DataFrame(fixed_rows, columns=headers)
+def rows_to_tsv_fast(headers: List[str], rows: List[List[str]]) -> str:
+    """TSV for the clipboard/text views using plain str.join instead of csv.writer.
 
+    Fields are names, codes and numbers, so they practically never need
+    quoting. If one does (embedded tab, newline or quote), the separator
+    counts give it away and we fall back to `rows_to_delimited`.
+    """
+    text = "\n".join(["\t".join(headers), *map("\t".join, rows)]) + "\n"
+    n_lines = len(rows) + 1
+    if (
+        '"' in text
+        or "\r" in text
+        or text.count("\n") != n_lines
+        or text.count("\t") != n_lines * (len(headers) - 1)
+    ):
+        return rows_to_delimited(headers, rows, delimiter="\t")
+    return text
+
+
+def rows_to_delimited_bytes(headers: List[str], rows: List[List[str]], delimiter: str) -> bytes:
+    """Like `rows_to_delimited`, but encodes straight into a UTF-8 bytes buffer.
+
+    Used for the download buttons so we don't build the full str and then a
+    second, encoded copy of it.
+    """
+    buf = io.BytesIO()
+    # Let the wrapper batch rows and encode them in chunks; flush() below
+    # pushes the tail into `buf`.
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=False)
+    writer = csv.writer(text, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(headers)
+    writer.writerows(rows)
+    text.flush()
+    return buf.getvalue()
 
-def copy_all_component(text_to_copy: str, button_label: str, key: str) -> None:
-    """Render a small HTML/JS component that copies provided text to clipboard.
 
-    Streamlit doesn't provide a native clipboard API, so we embed a tiny HTML snippet
-    that writes TSV text to `navigator.clipboard`.
+def dataframe_from_rows(headers: List[str], rows: List[List[str]]) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(columns=headers)
+    # events_to_rows/alternates_to_rows always emit exactly len(headers) columns.
+    assert len(rows[0]) == len(headers)
+    # Hand pandas one sequence per column; building from a dict of columns
+    # skips the row-to-column transpose it does for a list of rows.
+    return pd.DataFrame(dict(zip(headers, zip(*rows))), columns=headers)
+
+
+def workbook_bytes(events: List[Event], alternates: List[AlternateEntry], title: str) -> bytes:
+    """Build the XLSX workbook and return it as bytes."""
+    # The workbook is write-only, so drop it (and the buffer) as soon as the
+    # bytes are out rather than holding both copies.
+    wb = build_workbook(events, alternates, title)
+    xlsx_buf = io.BytesIO()
+    wb.save(xlsx_buf)
+    del wb
+    return xlsx_buf.getvalue()
 
-    To avoid HTML escaping issues, we pass the payload as base64.
-    """
 
-    import base64
-    import streamlit.components.v1 as components
+def derived_output(name: str, build: Callable[[], T]) -> T:
+    """Return a derived table/file for the current parse, building it on first use.
+
+    Outputs are deterministic for a given parse, so they live in
+    `st.session_state["derived"]` until a different PDF is parsed. Each one
+    is only built once something on the page actually needs it.
+    """
+    derived = st.session_state["derived"]
+    if name not in derived:
+        derived[name] = build()
+    return derived[name]
 
-    payload_b64 = base64.b64encode(text_to_copy.encode("utf-8")).decode("ascii")
 
-    html = f"""
+# Static markup for copy_all_component(); only the key, label and payload vary.
+_COPY_HTML_TEMPLATE = """
     <div style=\"display:flex; gap:0.5rem; align-items:center; margin: 0.25rem 0 0.75rem 0;\">
       <button id=\"btn-{key}\" style=\"padding:0.4rem 0.8rem; border-radius:0.4rem; border:1px solid #ccc; background:#ffffff; cursor:pointer;\">
-        {button_label}
+        {label}
       </button>
       <span id=\"status-{key}\" style=\"font-size:0.9rem; color:#555;\"></span>
     </div>
 
-    <textarea id=\"payload-{key}\" style=\"display:none;\">{payload_b64}</textarea>
-
     <script>
       const btn = document.getElementById(\"btn-{key}\");
       const status = document.getElementById(\"status-{key}\");
-      const b64 = document.getElementById(\"payload-{key}\").value;
-
-      function base64ToUtf8(b64Str) {{
-        const binStr = atob(b64Str);
-        const bytes = Uint8Array.from(binStr, (m) => m.charCodeAt(0));
-        return new TextDecoder("utf-8").decode(bytes);
-      }}
+      const payload = {payload};
 
       btn.addEventListener("click", async () => {{
         try {{
-          const payload = base64ToUtf8(b64);
           await navigator.clipboard.writeText(payload);
           status.textContent = "Copied to clipboard";
           setTimeout(() => status.textContent = "", 2000);
@@ -136,7 +196,21 @@ def copy_all_component(text_to_copy: str, button_label: str, key: str) -> None:
         }}
       }});
     </script>
+"""
+
+
+def copy_all_component(text_to_copy: str, button_label: str, key: str) -> None:
+    """Render a small HTML/JS component that copies provided text to clipboard.
+
+    Streamlit doesn't provide a native clipboard API, so we embed a tiny HTML snippet
+    that writes TSV text to `navigator.clipboard`.
+
+    The payload is embedded as a JSON string literal, which is already valid JS;
+    "</" is escaped so the text can't close the surrounding <script> tag.
     """
+    payload_js = json.dumps(text_to_copy, ensure_ascii=False).replace("</", "<\\/")
+
+    html = _COPY_HTML_TEMPLATE.format(key=key, label=button_label, payload=payload_js)
 
     components.html(html, height=70)
 
@@ -154,6 +228,7 @@ def main() -> None:
     col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
         preview_rows = st.number_input("Preview rows", min_value=10, max_value=500, value=50, step=10)
+        preview_n = int(preview_rows)
     with col2:
         include_alternates = st.checkbox("Include Alternates tab", value=True)
     with col3:
@@ -174,13 +249,16 @@ def main() -> None:
 
     if parse_clicked:
         try:
-            file_like = io.BytesIO(uploaded.getvalue())
-            title, events, alternates = parse_pdf(file_like)
+            pdf_bytes = uploaded.getvalue()
+            pdf_hash = pdf_digest(pdf_bytes)
+            title, events, alternates = _parse_pdf_cached(pdf_hash, pdf_bytes)
             st.session_state["parsed"] = {
                 "title": title,
                 "events": events,
                 "alternates": alternates,
                 "uploaded_name": uploaded.name,
+                "file_hash": pdf_hash,
+                "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             }
         except Exception as e:
             st.error("Failed to parse PDF")
@@ -195,56 +273,58 @@ def main() -> None:
     events = parsed["events"]
     alternates = parsed["alternates"]
 
+    # Streamlit reruns the whole script on every widget interaction, so the
+    # derived tables/files are built once per parsed PDF and reused.
+    if st.session_state.get("derived_key") != parsed["file_hash"]:
+        st.session_state["derived"] = {}
+        st.session_state["derived_key"] = parsed["file_hash"]
+
+    heats_rows = derived_output("heats_rows", lambda: events_to_rows(events))
+    if include_alternates:
+        alt_rows = derived_output("alt_rows", lambda: alternates_to_rows(alternates))
+
     st.subheader(title)
     st.write(
         {
             "events": len(events),
-            "heats_rows": sum(len(ev.heats) for ev in events),
+            "heats_rows": len(heats_rows),
             "alternates": len(alternates),
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": parsed["generated_at"],
         }
     )
 
-    heats_rows = events_to_rows(events)
-    heats_df = dataframe_from_rows(HEATS_HEADERS, heats_rows)
-
-    alt_rows = alternates_to_rows(alternates)
-    alt_df = dataframe_from_rows(ALT_HEADERS, alt_rows)
-
-    # Build XLSX in memory
-    wb = build_workbook(events, alternates, title)
-    xlsx_buf = io.BytesIO()
-    wb.save(xlsx_buf)
-    xlsx_bytes = xlsx_buf.getvalue()
-
-    # Build CSV/TSV
-    heats_csv = rows_to_delimited(HEATS_HEADERS, heats_rows, delimiter=",")
-    heats_tsv = rows_to_delimited(HEATS_HEADERS, heats_rows, delimiter="\t")
-
-    alt_csv = rows_to_delimited(ALT_HEADERS, alt_rows, delimiter=",")
-    alt_tsv = rows_to_delimited(ALT_HEADERS, alt_rows, delimiter="\t")
-
     st.divider()
 
     d1, d2, d3, d4 = st.columns([1, 1, 1, 1])
     with d1:
         st.download_button(
             "Download XLSX",
-            data=xlsx_bytes,
+            data=(
+                derived_output("xlsx_bytes", lambda: workbook_bytes(events, alternates, title))
+                if include_alternates
+                # Skip writing alternate rows into the workbook when the tab is off.
+                else derived_output("xlsx_bytes_no_alts", lambda: workbook_bytes(events, [], title))
+            ),
             file_name=f"{out_name}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
     with d2:
         st.download_button(
             "Download Heats CSV",
-            data=heats_csv.encode("utf-8"),
+            data=derived_output(
+                "heats_csv", lambda: rows_to_delimited_bytes(HEATS_HEADERS, heats_rows, delimiter=",")
+            ),
             file_name=f"{out_name}_heats.csv",
             mime="text/csv",
         )
     with d3:
         st.download_button(
             "Download Alternates CSV",
-            data=alt_csv.encode("utf-8"),
+            data=(
+                derived_output("alt_csv", lambda: rows_to_delimited_bytes(ALT_HEADERS, alt_rows, delimiter=","))
+                if include_alternates
+                else b""
+            ),
             file_name=f"{out_name}_alternates.csv",
             mime="text/csv",
             disabled=not include_alternates,
@@ -256,8 +336,11 @@ def main() -> None:
 
     with tabs[0]:
         st.markdown("### Heats Preview")
-        st.dataframe(heats_df.head(int(preview_rows)), use_container_width=True, hide_index=True)
+        # Only the previewed slice is turned into a DataFrame.
+        heats_df = dataframe_from_rows(HEATS_HEADERS, heats_rows[:preview_n])
+        st.dataframe(heats_df, use_container_width=True, hide_index=True)
         st.markdown("#### Copy all Heats (TSV)")
+        heats_tsv = derived_output("heats_tsv", lambda: rows_to_tsv_fast(HEATS_HEADERS, heats_rows))
         copy_all_component(heats_tsv, "Copy all Heats", key="heats")
         with st.expander("Show TSV text (optional)"):
             st.text_area("Heats TSV", heats_tsv, height=200)
@@ -265,8 +348,10 @@ def main() -> None:
     if include_alternates:
         with tabs[1]:
             st.markdown("### Alternates Preview")
-            st.dataframe(alt_df.head(int(preview_rows)), use_container_width=True, hide_index=True)
+            alt_df = dataframe_from_rows(ALT_HEADERS, alt_rows[:preview_n])
+            st.dataframe(alt_df, use_container_width=True, hide_index=True)
             st.markdown("#### Copy all Alternates (TSV)")
+            alt_tsv = derived_output("alt_tsv", lambda: rows_to_tsv_fast(ALT_HEADERS, alt_rows))
             copy_all_component(alt_tsv, "Copy all Alternates", key="alts")
             with st.expander("Show TSV text (optional)"):
                 st.text_area("Alternates TSV", alt_tsv, height=200)
@@ -14,32 +14,113 @@ Updated behaviours
 
 from __future__ import annotations
 
+import io
+import os
 import sys
 import re
 import datetime as dt
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Union, BinaryIO
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union, BinaryIO
 from pathlib import Path
 
 import pdfplumber
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
 
-AGE_PAT = re.compile(r"^(\d{1,2})$")
+# Precompiled patterns used per line / per token while parsing.
+WS_PAT = re.compile(r"\s+")
+# Multi-class codes like SM9/SM10/S14 etc.
+MC_PAT = re.compile(r"^S[A-Z]{0,2}\d{1,2}$", re.IGNORECASE)
+# Lowercase line prefixes of column headings / page furniture to skip.
+BOILERPLATE_PREFIXES = ("lane ", "name ", "age ", "team ", "finals program")
+
+# normalise_name(): the common “visitor” marker (V), then a multi-class code
+# appended at the end of the name (SM9, SM10, SM19, S14, SB9). Two passes, in
+# this order: a code glued to the marker ("Smith (V)SM9") only gets its leading
+# whitespace once (V) is gone.
+VISITOR_PAT = re.compile(r"\(\s*V\s*\)", re.IGNORECASE)
+TRAILING_MC_PAT = re.compile(r"\s+S[A-Z]{0,2}\d{1,2}\s*$", re.IGNORECASE)
+
+EVENT_HEADER_PAT = re.compile(r"^Event\s+(\d+[A-Za-z]*)\s+(Girls|Women|Boys|Men|Mixed)\s+(.+)$", re.IGNORECASE)
+EVENT_NUMBER_PAT = re.compile(r"(\d+)")
+# "<dist> LC Meter <stroke>", with "LC" optional
+DIST_STROKE_PAT = re.compile(r"(\d+)\s+(?:LC\s+)?Meter\s+(.+)$", re.IGNORECASE)
+MULTICLASS_PAT = re.compile(r"\bmulti\s*-?\s*class\b", re.IGNORECASE)
+
+# stroke_to_code() fast path, keyed on the whole lowercased stroke. Values
+# must agree with the substring checks in stroke_to_code(), which handle
+# anything not listed here.
+STROKE_CODES = {
+    "freestyle": "FS", "free": "FS",
+    "backstroke": "BK", "back": "BK",
+    "breaststroke": "BR", "breast": "BR",
+    "butterfly": "FLY", "fly": "FLY",
+    "individual medley": "IM", "medley": "IM", "im": "IM",
+}
+
+HEAT_LINE_PAT = re.compile(r"^(Final|Heat|Super Final)\s+(.+)$", re.IGNORECASE)
+# Lowercase prefixes a HEAT_LINE_PAT match must start with ("super" rather than
+# "super final", since the label is whitespace-normalised before matching).
+HEAT_LINE_PREFIXES = ("final", "heat", "super")
+
+# Age fragments stripped from heat labels by clean_heat_label(), applied one
+# after another. The order matters: a later pattern may match text exposed by
+# an earlier removal, which a single fused alternation would not reproduce.
+# IMPORTANT: range patterns must run BEFORE single-age patterns. Otherwise e.g.
+# "12-13 Years Olds" might match the "13 Years Olds" tail first, leaving
+# behind a stray "12".
+HEAT_AGE_PATS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # 12-13 Years & Old / 12-16 Years Olds / 12 - 13 Years Old
+    r"\b\d{1,2}\s*-\s*\d{1,2}\s*Years?\s*(?:&|and)?\s*Olds?\b",
+
+    # Some PDFs render as: "12-16 Years" (no Old/Over word)
+    r"\b\d{1,2}\s*-\s*\d{1,2}\s*Years?\b",
+
+    # 17 Years & Over / 17 Years and Over
+    r"\b\d{1,2}\s*Years?\s*(?:&|and)\s*(?:Over|Under)\b",
+    r"\b\d{1,2}\s*(?:&|and)\s*(?:Over|Under)\b",
+
+    # 15 Year Olds / 15 Years Old
+    r"\b\d{1,2}\s*Years?\s*Olds?\b",
+
+    # Some PDFs render as: "Years & Over" without the preceding number token
+    r"\bYears?\s*(?:&|and)\s*(?:Over|Under)\b",
+))
+HEAT_BARE_AGE_PAT = re.compile(r"^(\S+)\s+\d{1,2}$")
+
+MEET_DATES_PAT = re.compile(r"-\s*(\d{1,2}/\d{1,2}/\d{4})\s+to\s+(\d{1,2}/\d{1,2}/\d{4})")
+NIGHT_PAT = re.compile(r"Night\s+(One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+)", re.IGNORECASE)
 
 # Optional safety cap on how many heats/finals we keep per event.
 # Set to None for unlimited.
 # Example: MAX_HEATS_PER_EVENT = 3
 MAX_HEATS_PER_EVENT: Optional[int] = None
 
-@dataclass
+# Page text is extracted across a process pool once a PDF has at least this
+# many pages per available worker; below that, pool startup and re-opening the
+# PDF in each worker cost more than they save.
+PARALLEL_MIN_PAGES = 8
+
+# cgroup v2 CPU quota file; containers (e.g. Streamlit Cloud) are often capped
+# well below the host CPU count that os.cpu_count() reports.
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+# slots=True (Python 3.10+): these are created per heat/alternate and read in
+# tight loops when building rows, so skip the per-instance __dict__.
+@dataclass(slots=True)
 class Heat:
     raw_label: str
     label: str
-    lanes: Dict[int, str] = field(default_factory=dict)
+    # indexed by lane number 0-9; "" for an empty lane
+    lanes: List[str] = field(default_factory=lambda: [""] * 10)
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     number: int
     gender: str           # W/M/X
@@ -47,7 +128,7 @@ class Event:
     age_group: str        # e.g. 15 & Over
     heats: List[Heat] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class AlternateEntry:
     event_no: int
     gender: str
@@ -60,6 +141,9 @@ class AlternateEntry:
     team: str = ""
     prelim: str = ""
 
+# Names repeat across heats/alternates and strokes repeat constantly, and both
+# functions are pure str -> str, so results are memoised.
+@lru_cache(maxsize=8192)
 def normalise_name(name: str) -> str:
     """Normalise swimmer names.
 
@@ -68,24 +152,20 @@ def normalise_name(name: str) -> str:
     - Normalises commas/whitespace
     - Uppercases
     """
-    name = name.strip()
-
-    # Remove common “visitor” marker.
-    name = re.sub(r"\(\s*V\s*\)", "", name, flags=re.IGNORECASE)
+    name = VISITOR_PAT.sub("", name.strip())
+    name = TRAILING_MC_PAT.sub("", name)
 
-    # Remove trailing multi-class codes, typically appended at end of the name.
-    # Examples: SM9, SM10, SM19, S14, SB9
-    name = re.sub(r"\s+S[A-Z]{0,2}\d{1,2}\s*$", "", name, flags=re.IGNORECASE)
-
-    # Normalise punctuation/spacing
-    name = name.replace(" ,", ",").replace(",", ", ")
-    name = re.sub(r",\s+", ", ", name)
-    name = re.sub(r"\s+", " ", name)
-
-    return name.strip().upper()
+    # Normalise punctuation/spacing: exactly ", " after each comma, single spaces.
+    name = ", ".join(part.strip() for part in name.split(","))
+    return " ".join(name.split()).upper()
 
+@lru_cache(maxsize=64)
 def stroke_to_code(stroke: str) -> str:
     s = stroke.strip().lower()
+    # exact stroke names seen in programs
+    code = STROKE_CODES.get(s)
+    if code is not None:
+        return code
     # common variants
     if "free" in s:
         return "FS"
@@ -98,7 +178,7 @@ def stroke_to_code(stroke: str) -> str:
     if "medley" in s or "im" == s:
         return "IM"
     # fallback: squeeze
-    return re.sub(r"\s+", "", stroke).upper()
+    return WS_PAT.sub("", stroke).upper()
 
 def parse_event_header(line: str) -> Optional[Tuple[int, str, str, str]]:
     """
@@ -109,37 +189,35 @@ def parse_event_header(line: str) -> Optional[Tuple[int, str, str, str]]:
       (1, 'W', '50FS', '15 & Over')
       (57, 'W', '50BR', '15 & Over')
     """
-    line = re.sub(r"\s+", " ", line.strip())
-    m = re.match(r"^Event\s+(\d+[A-Za-z]*)\s+(Girls|Women|Boys|Men|Mixed)\s+(.+)$", line, re.IGNORECASE)
+    line = " ".join(line.split())
+    m = EVENT_HEADER_PAT.match(line)
     if not m:
         return None
 
     # Extract numeric part only (e.g., "57A" -> 57)
     number_str = m.group(1)
-    number = int(re.match(r"(\d+)", number_str).group(1))
+    number = int(EVENT_NUMBER_PAT.match(number_str).group(1))
     gender_word = m.group(2).lower()
     gender = {"girls":"W","women":"W","boys":"M","men":"M","mixed":"X"}.get(gender_word, "")
 
     rest = m.group(3).strip()
 
-    # Find distance + stroke at end: "<dist> LC Meter <stroke>"
-    m2 = re.search(r"(\d+)\s+LC\s+Meter\s+(.+)$", rest, re.IGNORECASE)
-    if not m2:
-        # fallback: try "Meter" without LC
-        m2 = re.search(r"(\d+)\s+Meter\s+(.+)$", rest, re.IGNORECASE)
+    # Find distance + stroke at end: "<dist> LC Meter <stroke>" (or just "Meter")
+    m2 = DIST_STROKE_PAT.search(rest)
     if not m2:
         return number, gender, rest.upper(), ""  # worst-case fallback
 
     dist = m2.group(1)
-    stroke_raw = re.sub(r"\s+", " ", m2.group(2).strip())
+    # line is already whitespace-normalised, so the stroke needs no collapsing
+    stroke_raw = m2.group(2)
 
     # Multi-class events sometimes appear as e.g. "IM Multi-Class".
     # We want: "200IM MC" (not "200IMMULTI-CLASS").
-    is_multiclass = bool(re.search(r"\bmulti\s*-?\s*class\b", stroke_raw, flags=re.IGNORECASE))
-
-    # Remove the multi-class marker from the stroke descriptor before coding.
-    stroke = re.sub(r"\bmulti\s*-?\s*class\b", "", stroke_raw, flags=re.IGNORECASE).strip()
-    stroke = re.sub(r"\s+", " ", stroke)
+    # Remove the marker from the stroke descriptor before coding; one subn
+    # call both strips it and tells us whether it was there.
+    stroke, n_mc = MULTICLASS_PAT.subn("", stroke_raw)
+    is_multiclass = n_mc > 0
+    stroke = " ".join(stroke.split())
 
     age_group = rest[:m2.start()].strip()  # everything before distance
     event_code = f"{dist}{stroke_to_code(stroke)}" + (" MC" if is_multiclass else "")
@@ -158,42 +236,22 @@ def clean_heat_label(label: str) -> str:
       "5a 12" -> "5a"
       "1a Super Final" -> "1a Super Final" (unchanged)
     """
-    s = re.sub(r"\s+", " ", label.strip())
+    s = WS_PAT.sub(" ", label.strip())
 
     # Normalise unicode dashes into '-' for easier matching.
     s = s.replace("–", "-").replace("—", "-")
 
-    # IMPORTANT: range patterns must run BEFORE single-age patterns.
-    # Otherwise e.g. "12-13 Years Olds" might match the "13 Years Olds" tail first,
-    # leaving behind a stray "12".
-    patterns = [
-        # 12-13 Years & Old / 12-16 Years Olds / 12 - 13 Years Old
-        r"\b\d{1,2}\s*-\s*\d{1,2}\s*Years?\s*(?:&|and)?\s*Olds?\b",
-
-        # Some PDFs render as: "12-16 Years" (no Old/Over word)
-        r"\b\d{1,2}\s*-\s*\d{1,2}\s*Years?\b",
-
-        # 17 Years & Over / 17 Years and Over
-        r"\b\d{1,2}\s*Years?\s*(?:&|and)\s*(?:Over|Under)\b",
-        r"\b\d{1,2}\s*(?:&|and)\s*(?:Over|Under)\b",
-
-        # 15 Year Olds / 15 Years Old
-        r"\b\d{1,2}\s*Years?\s*Olds?\b",
-
-        # Some PDFs render as: "Years & Over" without the preceding number token
-        r"\bYears?\s*(?:&|and)\s*(?:Over|Under)\b",
-    ]
-
-    for pat in patterns:
-        s = re.sub(pat, "", s, flags=re.IGNORECASE)
+    # Strip age fragments in order (ranges first; see HEAT_AGE_PATS).
+    for pat in HEAT_AGE_PATS:
+        s = pat.sub("", s)
 
-    s = re.sub(r"\s+", " ", s).strip()
+    s = WS_PAT.sub(" ", s).strip()
 
     # Clean up trailing separators early (so bare-age removal can match).
     s = s.rstrip("- ").strip()
 
     # If label looks like "3a 12" (heat + bare age), drop the trailing age.
-    s = re.sub(r"^(\S+)\s+\d{1,2}$", r"\1", s)
+    s = HEAT_BARE_AGE_PAT.sub(r"\1", s)
 
     return s.strip()
 
@@ -205,35 +263,57 @@ def parse_heat_label(line: str) -> Optional[str]:
     "Heat 2" -> "2"
     "Super Final 57a" -> "57a"
     """
-    line = re.sub(r"\s+", " ", line.strip())
-    m = re.match(r"^(Final|Heat|Super Final)\s+(.+)$", line, re.IGNORECASE)
+    line = WS_PAT.sub(" ", line.strip())
+    m = HEAT_LINE_PAT.match(line)
     if not m:
         return None
     return clean_heat_label(m.group(2).strip())
 
+# Token predicates for lane/alternate lines. These run on every token, so
+# they use plain str checks instead of regexes.
+
+def _is_age_token(tok: str) -> bool:
+    # standalone one- or two-digit age, e.g. 16
+    return len(tok) <= 2 and tok.isdecimal()
+
+def _is_sex_age_token(tok: str) -> bool:
+    # Sex+age tokens sometimes included in exports (e.g. W17 / M15)
+    return 2 <= len(tok) <= 3 and tok[0] in "MWXmwx" and tok[1:].isdecimal()
+
+def _is_mc_token(tok: str) -> bool:
+    # Multi-class codes like SM9/SM10/S14 etc. always end in a digit; only
+    # those tokens are worth running MC_PAT on.
+    return tok[-1].isdecimal() and MC_PAT.match(tok) is not None
+
+def _is_time_token(tok: str, allow_seconds: bool) -> bool:
+    """NT or m:ss.hh / mm:ss.hh; with `allow_seconds`, also s.hh / ss.hh."""
+    if tok.upper() == "NT":
+        return True
+    head, dot, hundredths = tok.rpartition(".")
+    if not dot or len(hundredths) != 2 or not hundredths.isdecimal():
+        return False
+    minutes, colon, seconds = head.partition(":")
+    if colon:
+        return 1 <= len(minutes) <= 2 and minutes.isdecimal() and len(seconds) == 2 and seconds.isdecimal()
+    return allow_seconds and 1 <= len(head) <= 2 and head.isdecimal()
+
 def parse_lane_line(line: str) -> Optional[Tuple[int, str]]:
+    # "<single digit lane> <rest>"; plain str checks are cheaper than a regex
     line = line.strip()
-    m = re.match(r"^([0-9])\s+(.*)$", line)
-    if not m:
+    if len(line) < 3 or line[0] not in "0123456789" or not line[1].isspace():
         return None
-    lane = int(m.group(1))
-    rest = m.group(2).strip()
-    tokens = rest.split()
-
-    # Multi-class codes like SM9/SM10/S14 etc.
-    mc_pat = re.compile(r"^S[A-Z]{0,2}\d{1,2}$", re.IGNORECASE)
-    # Sex+age tokens sometimes included in exports (e.g. W17 / M15)
-    sex_age_pat = re.compile(r"^[MWX]\d{1,2}$", re.IGNORECASE)
+    lane = int(line[0])
+    tokens = line[2:].split()
 
     name_tokens: List[str] = []
     for tok in tokens:
-        if AGE_PAT.match(tok):
+        if _is_age_token(tok):
             break
-        if sex_age_pat.match(tok):
+        if _is_sex_age_token(tok):
             break
-        if mc_pat.match(tok):
+        if _is_mc_token(tok):
             break
-        if re.match(r"^(NT|\d{1,2}:\d{2}\.\d{2})$", tok, re.IGNORECASE):
+        if _is_time_token(tok, allow_seconds=False):
             break
         name_tokens.append(tok)
 
@@ -252,30 +332,26 @@ def parse_alternate_line(line: str) -> Optional[Tuple[int, str, str, str]]:
       2 Hamilton (V), Nafanua 15 Samoa 27.74
     Returns: (rank, NAME, TEAM, PRELIMS)
     """
-    line = re.sub(r"\s+", " ", line.strip())
-    m = re.match(r"^(\d+)\s+(.*)$", line)
-    if not m:
+    parts = line.split(None, 1)
+    if len(parts) < 2 or not parts[0].isdecimal():
         return None
-    rank = int(m.group(1))
-    rest = m.group(2).strip()
-    tokens = rest.split()
+    rank = int(parts[0])
+    tokens = parts[1].split()
 
     # name tokens up to first standalone age (number)
     name_tokens: List[str] = []
     idx_age = None
-    mc_pat = re.compile(r"^S[A-Z]{0,2}\d{1,2}$", re.IGNORECASE)
-    sex_age_pat = re.compile(r"^[MWX]\d{1,2}$", re.IGNORECASE)
 
     for i, tok in enumerate(tokens):
-        if AGE_PAT.match(tok):
+        if _is_age_token(tok):
             idx_age = i
             break
         # sometimes there are sex+age tokens like W17/M15 in some programs
-        if sex_age_pat.match(tok):
+        if _is_sex_age_token(tok):
             idx_age = i
             break
         # multi-class code embedded in alternates lists
-        if mc_pat.match(tok):
+        if _is_mc_token(tok):
             idx_age = i
             break
         name_tokens.append(tok)
@@ -293,7 +369,7 @@ def parse_alternate_line(line: str) -> Optional[Tuple[int, str, str, str]]:
         rem = tokens[idx_age+1:]
         # prelim time is usually last time-like token
         for j, tok in enumerate(rem):
-            if re.match(r"^\d{1,2}:\d{2}\.\d{2}$|^\d{1,2}\.\d{2}$|^NT$", tok, re.IGNORECASE):
+            if _is_time_token(tok, allow_seconds=True):
                 # team is tokens before this, prelim is this token
                 team = " ".join(rem[:j]).strip()
                 prelim = tok
@@ -305,6 +381,19 @@ def parse_alternate_line(line: str) -> Optional[Tuple[int, str, str, str]]:
 
     return rank, name, team.upper(), prelim
 
+def _is_date_line(line: str) -> bool:
+    """True for lines starting "dddd-dd" followed by a word boundary (e.g. "2025-03 ...").
+
+    Plain slicing rather than a regex, since it runs on every numbered line.
+    """
+    return (
+        len(line) >= 7
+        and line[4] == "-"
+        and line[:4].isdecimal()
+        and line[5:7].isdecimal()
+        and (len(line) == 7 or not (line[7].isalnum() or line[7] == "_"))
+    )
+
 def _discover_pdfs_in_cwd() -> List[Path]:
     """Return PDFs in the current working directory.
 
@@ -348,12 +437,12 @@ def infer_day_title(first_page_lines: List[str]) -> str:
     program_line = first_page_lines[1] if len(first_page_lines) > 1 else ""
 
     start_date = None
-    m = re.search(r"-\s*(\d{1,2}/\d{1,2}/\d{4})\s+to\s+(\d{1,2}/\d{1,2}/\d{4})", meet_line)
+    m = MEET_DATES_PAT.search(meet_line)
     if m:
         start_date = dt.datetime.strptime(m.group(1), "%d/%m/%Y").date()
 
     night_no = 1
-    m2 = re.search(r"Night\s+(One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+)", program_line, re.IGNORECASE)
+    m2 = NIGHT_PAT.search(program_line)
     if m2:
         token = m2.group(1).lower()
         words = {"one":1,"two":2,"three":3,"four":4,"five":5,"six":6,"seven":7,"eight":8,"nine":9,"ten":10}
@@ -363,6 +452,69 @@ def infer_day_title(first_page_lines: List[str]) -> str:
     date_str = date.strftime("%d/%m/%Y") if date else ""
     return f"Day {night_no} Heats - {date_str}"
 
+def _page_text(page) -> str:
+    """Line-broken text for one pdfplumber page.
+
+    Uses pdfplumber's simple extractor, which groups chars into lines by
+    position and skips the word/layout pass `extract_text()` runs. It may keep
+    runs of spaces that `extract_text()` collapses, but every parser here
+    normalises whitespace anyway.
+    """
+    return page.extract_text_simple() or ""
+
+def _source_bytes(pdf_source: BinaryIO) -> bytes:
+    if isinstance(pdf_source, io.BytesIO):
+        return pdf_source.getvalue()
+    pdf_source.seek(0)
+    return pdf_source.read()
+
+def _extract_page_range(args: Tuple[bytes, int, int]) -> List[str]:
+    """Worker for `_extract_pages_parallel`: text for pages [start, stop)."""
+    data, start, stop = args
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return [_page_text(pdf.pages[i]) for i in range(start, stop)]
+
+def _available_cpus() -> int:
+    """CPUs this process may actually use: affinity mask, capped by a cgroup quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    try:
+        # "<quota> <period>", or "max <period>" when unlimited
+        quota, period = CGROUP_CPU_MAX.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+def _pool_context():
+    """Start method for the extraction pool.
+
+    Never fork: the Streamlit server is multi-threaded, and forking a threaded
+    process can deadlock the child. forkserver forks from a clean helper
+    process instead; spawn is the portable fallback.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def _extract_pages_parallel(data: bytes, n_pages: int, workers: int) -> Optional[List[str]]:
+    """Extract page text across a process pool, one contiguous page range per worker.
+
+    Only text extraction is parallelised; the line parsing in `parse_pdf` is
+    order-dependent and stays serial. Returns None if a pool can't be used
+    here (e.g. restricted hosts), so the caller falls back to serial.
+    """
+    step = -(-n_pages // workers)  # ceil division
+    ranges = [(data, start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=_pool_context()) as ex:
+            chunks = list(ex.map(_extract_page_range, ranges))
+    except (OSError, BrokenProcessPool, NotImplementedError):
+        return None
+    return [text for chunk in chunks for text in chunk]
+
 def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event], List[AlternateEntry]]:
     """Parse a meet program PDF into structured events + alternates.
 
@@ -370,10 +522,21 @@ def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event],
       - a filesystem path (str/Path) (CLI usage)
       - a file-like object / BytesIO (Streamlit uploads)
 
-    pdfplumber can open both.
+    pdfplumber can open both. Paths are read into memory first: PDF parsing
+    does many small seeks/reads, which are cheaper against a BytesIO than a
+    file handle.
     """
+    if isinstance(pdf_source, (str, Path)):
+        pdf_source = io.BytesIO(Path(pdf_source).read_bytes())
+
     with pdfplumber.open(pdf_source) as pdf:
-        pages = [(p.extract_text() or "") for p in pdf.pages]
+        n_pages = len(pdf.pages)
+        workers = min(_available_cpus(), n_pages // PARALLEL_MIN_PAGES)
+        pages = None
+        if workers > 1:
+            pages = _extract_pages_parallel(_source_bytes(pdf_source), n_pages, workers)
+        if pages is None:
+            pages = [_page_text(p) for p in pdf.pages]
 
     title = infer_day_title(pages[0].splitlines())
 
@@ -386,13 +549,19 @@ def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event],
     current_alt_group = ""
 
     for page_text in pages:
-        for raw in page_text.splitlines():
+        # pdfplumber joins lines with "\n"; a plain split is cheaper than splitlines().
+        for raw in page_text.split("\n"):
             line = raw.strip()
             if not line:
                 continue
 
+            low = line.lower()
+
+            # Each parser below is gated on a cheap prefix / first-char check
+            # so a line only reaches the regex that could actually match it.
+
             # new event
-            ev = parse_event_header(line)
+            ev = parse_event_header(line) if low.startswith("event") else None
             if ev:
                 if current_event:
                     events.append(current_event)
@@ -406,25 +575,19 @@ def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event],
             if not current_event:
                 continue
 
-            low = line.lower()
-
             # skip boilerplate
-            if low.startswith("lane ") or low.startswith("name ") or low.startswith("age ") or low.startswith("team "):
-                continue
-            if low.startswith("finals program"):
-                continue
-            if re.match(r"^\d{4}-\d{2}\b", line):
+            if low.startswith(BOILERPLATE_PREFIXES):
                 continue
 
             # alternates heading
             if low.startswith("alternates"):
                 in_alternates = True
-                current_alt_group = re.sub(r"\s+", " ", line.strip())
+                current_alt_group = WS_PAT.sub(" ", line.strip())
                 # stop collecting lanes into heat while in alternates
                 continue
 
             # new heat start ends alternates mode
-            heat_label = parse_heat_label(line)
+            heat_label = parse_heat_label(line) if low.startswith(HEAT_LINE_PREFIXES) else None
             if heat_label is not None:
                 in_alternates = False
                 current_alt_group = ""
@@ -436,6 +599,14 @@ def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event],
                     current_event.heats.append(current_heat)
                 continue
 
+            # alternate and lane lines both start with a rank/lane number
+            if not line[0].isdecimal():
+                continue
+
+            # skip "2025-03 ..." style date/footer lines
+            if _is_date_line(line):
+                continue
+
             # while in alternates: collect alternate lines, but do NOT treat as lanes
             if in_alternates:
                 parsed_alt = parse_alternate_line(line)
@@ -468,128 +639,110 @@ def parse_pdf(pdf_source: Union[str, Path, BinaryIO]) -> Tuple[str, List[Event],
 
     return title, events, alternates
 
+# Shared openpyxl styles. Style objects are immutable, so every cell can reuse
+# the same instances instead of allocating its own.
+TITLE_FONT = Font(bold=True, size=14)
+TITLE_ALIGN = Alignment(horizontal="center", vertical="center")
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill("solid", fgColor="D9D9D9")
+ALIGN_CENTER = Alignment(horizontal="center", vertical="center", wrap_text=True)
+ALIGN_LEFT = Alignment(horizontal="left", vertical="center")
+_THIN = Side(style="thin", color="999999")
+BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+# alternating per-event row colours on the Heats sheet
+PASTEL_FILLS = tuple(PatternFill("solid", fgColor=c) for c in ("FFF2CC", "DDEBF7", "E2F0D9"))
+
+# Blank Analyst columns, built once for the Heats rows.
+_BLANK_ANALYSTS = ("", "", "", "")
+
+def _styled_cell(ws, value, font=None, fill=None, border=None, alignment=None) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
 def build_workbook(events: List[Event], alternates: List[AlternateEntry], title: str) -> Workbook:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Heats"
+    """Build the Heats/Alternates workbook.
+
+    Uses openpyxl's write-only mode so rows are streamed out as they are
+    appended instead of keeping every cell object in memory. Because of that,
+    column widths, freeze panes and row heights are set before any rows are
+    written, and each cell is styled as it is created. The returned workbook
+    can only be saved once.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Heats")
 
     headers = ["#", "Gender", "Event", "Age Group", "Heat", "Cal"] + [f"Lane {i}" for i in range(10)] + [f"Analyst {i}" for i in range(1, 5)]
     ncols = len(headers)
 
-    # Row 1 title
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=ncols)
-    c = ws.cell(row=1, column=1, value=title)
-    c.font = Font(bold=True, size=14)
-    c.alignment = Alignment(horizontal="center", vertical="center")
-    ws.row_dimensions[1].height = 22
+    # column widths
+    widths = {
+        1: 5, 2: 8, 3: 10, 4: 14, 5: 18, 6: 6
+    }
+    for i in range(10):
+        widths[7+i] = 22
+    for i in range(4):
+        widths[17+i] = 10
 
-    # Row 2 headers
-    header_fill = PatternFill("solid", fgColor="D9D9D9")
-    for col, h in enumerate(headers, start=1):
-        cell = ws.cell(row=2, column=col, value=h)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.fill = header_fill
+    for col, w in widths.items():
+        ws.column_dimensions[get_column_letter(col)].width = w
+
+    ws.row_dimensions[1].height = 22
     ws.row_dimensions[2].height = 20
     ws.freeze_panes = "A3"
 
-    thin = Side(style="thin", color="999999")
-    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    # Row 1 title
+    ws.merged_cells.add(f"A1:{get_column_letter(ncols)}1")
+    ws.append([_styled_cell(ws, title, font=TITLE_FONT, alignment=TITLE_ALIGN)])
 
-    pastel = ["FFF2CC", "DDEBF7", "E2F0D9"]
+    # Row 2 headers
+    ws.append([
+        _styled_cell(ws, h, font=HEADER_FONT, fill=HEADER_FILL, border=BORDER, alignment=ALIGN_CENTER)
+        for h in headers
+    ])
 
     row = 3
     for idx, ev in enumerate(events):
-        fill = PatternFill("solid", fgColor=pastel[idx % 3])
+        fill = PASTEL_FILLS[idx % 3]
         start_row = row
 
         for heat in ev.heats:
-            ws.cell(row=row, column=1, value=ev.number).fill = fill
-            ws.cell(row=row, column=2, value=ev.gender).fill = fill
-            ws.cell(row=row, column=3, value=ev.event_code).fill = fill
-            ws.cell(row=row, column=4, value=ev.age_group).fill = fill
-            ws.cell(row=row, column=5, value=heat.label).fill = fill
-            ws.cell(row=row, column=6, value="").fill = fill  # Cal blank
-
-            # lanes
-            for lane in range(10):
-                col = 7 + lane
-                ws.cell(row=row, column=col, value=heat.lanes.get(lane, "")).fill = fill
-
-            # analysts blank
-            for a in range(4):
-                ws.cell(row=row, column=17 + a, value="").fill = fill
-
+            # Cal blank, then lanes, then analysts blank
+            values = (ev.number, ev.gender, ev.event_code, ev.age_group, heat.label, "",
+                      *heat.lanes, *_BLANK_ANALYSTS)
+
+            cells = []
+            for col, value in enumerate(values, start=1):
+                if row > start_row and col <= 4:
+                    # covered by the event-level merge below
+                    cells.append(_styled_cell(ws, None, border=BORDER, alignment=ALIGN_CENTER))
+                else:
+                    cells.append(_styled_cell(
+                        ws, value, fill=fill, border=BORDER,
+                        alignment=ALIGN_LEFT if col >= 7 else ALIGN_CENTER,
+                    ))
+            ws.append(cells)
             row += 1
 
         end_row = row - 1
         if end_row >= start_row:
             # merge event-level columns across heats
             for col in [1,2,3,4]:
-                ws.merge_cells(start_row=start_row, start_column=col, end_row=end_row, end_column=col)
-                ws.cell(row=start_row, column=col).alignment = Alignment(horizontal="center", vertical="center")
-
-    # borders + align
-    for r in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ncols):
-        for cell in r:
-            cell.border = border
-            if cell.row >= 3 and cell.column >= 7:
-                cell.alignment = Alignment(horizontal="left", vertical="center")
-            else:
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-    # column widths
-    widths = {
-        1: 5, 2: 8, 3: 10, 4: 14, 5: 18, 6: 6
-    }
-    for i in range(10):
-        widths[7+i] = 22
-    for i in range(4):
-        widths[17+i] = 10
-
-    for col, w in widths.items():
-        ws.column_dimensions[get_column_letter(col)].width = w
+                letter = get_column_letter(col)
+                ws.merged_cells.add(f"{letter}{start_row}:{letter}{end_row}")
 
     # Alternates sheet
     ws2 = wb.create_sheet("Alternates")
     alt_headers = ["#", "Gender", "Event", "Age Group", "Heat", "Alt Group", "Alt Rank", "Name", "Team", "Prelims"]
     alt_ncols = len(alt_headers)
 
-    ws2.merge_cells(start_row=1, start_column=1, end_row=1, end_column=alt_ncols)
-    c2 = ws2.cell(row=1, column=1, value=title + " (Alternates)")
-    c2.font = Font(bold=True, size=14)
-    c2.alignment = Alignment(horizontal="center", vertical="center")
-    ws2.row_dimensions[1].height = 22
-
-    for col, h in enumerate(alt_headers, start=1):
-        cell = ws2.cell(row=2, column=col, value=h)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.fill = header_fill
-    ws2.freeze_panes = "A3"
-
-    r = 3
-    for a in alternates:
-        ws2.cell(r,1,a.event_no)
-        ws2.cell(r,2,a.gender)
-        ws2.cell(r,3,a.event_code)
-        ws2.cell(r,4,a.age_group)
-        ws2.cell(r,5,a.heat_label)
-        ws2.cell(r,6,a.alt_group)
-        ws2.cell(r,7,a.rank)
-        ws2.cell(r,8,a.name)
-        ws2.cell(r,9,a.team)
-        ws2.cell(r,10,a.prelim)
-        r += 1
-
-    for row_cells in ws2.iter_rows(min_row=2, max_row=ws2.max_row, min_col=1, max_col=alt_ncols):
-        for cell in row_cells:
-            cell.border = border
-            if cell.column in (8,9,6):
-                cell.alignment = Alignment(horizontal="left", vertical="center")
-            else:
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
     ws2.column_dimensions["A"].width = 5
     ws2.column_dimensions["B"].width = 8
     ws2.column_dimensions["C"].width = 10
@@ -601,6 +754,27 @@ def build_workbook(events: List[Event], alternates: List[AlternateEntry], title:
     ws2.column_dimensions["I"].width = 18
     ws2.column_dimensions["J"].width = 10
 
+    ws2.row_dimensions[1].height = 22
+    ws2.freeze_panes = "A3"
+
+    ws2.merged_cells.add(f"A1:{get_column_letter(alt_ncols)}1")
+    ws2.append([_styled_cell(ws2, title + " (Alternates)", font=TITLE_FONT, alignment=TITLE_ALIGN)])
+
+    # Alt Group / Name / Team are left-aligned, header row included
+    alt_aligns = [ALIGN_LEFT if col in (8,9,6) else ALIGN_CENTER for col in range(1, alt_ncols + 1)]
+
+    ws2.append([
+        _styled_cell(ws2, h, font=HEADER_FONT, fill=HEADER_FILL, border=BORDER, alignment=align)
+        for h, align in zip(alt_headers, alt_aligns)
+    ])
+
+    for a in alternates:
+        values = [a.event_no, a.gender, a.event_code, a.age_group, a.heat_label, a.alt_group, a.rank, a.name, a.team, a.prelim]
+        ws2.append([
+            _styled_cell(ws2, value, border=BORDER, alignment=align)
+            for value, align in zip(values, alt_aligns)
+        ])
+
     return wb
 
 def main() -> int: